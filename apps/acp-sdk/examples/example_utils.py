@@ -0,0 +1,24 @@
+"""
+Helpers shared by the ACP SDK examples.
+
+This is not an example itself; the example scripts import it from their own
+directory.
+"""
+
+import itertools
+import uuid
+
+try:
+    import uvloop
+    LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:  # uvloop (via uvicorn[standard]) is not available on Windows
+    LOOP_FACTORY = None
+
+# Task ids are a per-process tag plus a sequence number
+_TASK_TAG = uuid.uuid4().hex[:8]
+_TASK_SEQ = itertools.count()
+
+
+def next_task_id() -> str:
+    """Generate a unique task id without reading the clock."""
+    return f"task_{_TASK_TAG}_{next(_TASK_SEQ)}"
@@ -8,8 +8,9 @@ ACP compliance.
 """
 
 import asyncio
+import re
 import click
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, List
 
 # LlamaIndex imports
 from llama_index.agent import ReActAgent
@@ -17,6 +18,8 @@ from llama_index.llms import OpenAI
 from llama_index.tools import FunctionTool
 from llama_index.core.tools import BaseTool
 
+from example_utils import LOOP_FACTORY, next_task_id
+
 # ACP SDK imports
 from acp_sdk import (
     ACPConfig, 
@@ -42,6 +45,35 @@ RESTAURANT_CONFIG = ACPConfig(
     ]
 )
 
+# Mock menu used for recommendations, with the main-course variants for
+# dietary restrictions and preferences
+BASE_MENU = {
+    "appetizers": ("Bruschetta", "Calamari", "Caprese Salad"),
+    "main_courses": ("Margherita Pizza", "Pasta Carbonara", "Grilled Salmon"),
+    "desserts": ("Tiramisu", "Gelato", "Cannoli"),
+}
+VEGETARIAN_MAINS = ("Margherita Pizza", "Pasta Carbonara", "Vegetable Risotto")
+GLUTEN_FREE_MAINS = ("Grilled Salmon", "Vegetable Risotto", "Gluten-Free Pizza")
+SPICY_MAIN = "Spicy Arrabbiata Pasta"
+
+# Sentiment keywords for the mock feedback analysis
+POSITIVE_WORDS = frozenset({"great", "amazing", "delicious", "wonderful", "excellent"})
+NEGATIVE_WORDS = frozenset({"bad", "terrible", "awful", "disgusting", "poor"})
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Upselling suggestion per ordered dish, matched in a single pass over the order
+UPSELL_SUGGESTIONS = {
+    "pizza": "Add extra cheese or premium toppings",
+    "pasta": "Add garlic bread or side salad",
+    "salad": "Add protein (chicken, shrimp, or salmon)",
+}
+_UPSELL_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, UPSELL_SUGGESTIONS)) + r")\b", re.IGNORECASE
+)
+
+# Upper bound on concurrent agent queries (and so on in-flight LLM requests)
+MAX_CONCURRENT_QUERIES = 10
+
 
 class LlamaIndexRestaurantTools:
     """Custom tools for LlamaIndex restaurant agent."""
@@ -55,36 +87,34 @@ class LlamaIndexRestaurantTools:
         """Get personalized menu recommendations based on customer preferences."""
         preferences = self.customer_preferences.get(customer_id, {})
         
-        # Mock menu with recommendations
-        menu = {
-            "appetizers": ["Bruschetta", "Calamari", "Caprese Salad"],
-            "main_courses": ["Margherita Pizza", "Pasta Carbonara", "Grilled Salmon"],
-            "desserts": ["Tiramisu", "Gelato", "Cannoli"]
-        }
+        main_courses = BASE_MENU["main_courses"]
         
         # Apply dietary restrictions
         if dietary_restrictions:
-            if "vegetarian" in dietary_restrictions.lower():
-                menu["main_courses"] = ["Margherita Pizza", "Pasta Carbonara", "Vegetable Risotto"]
-            if "gluten-free" in dietary_restrictions.lower():
-                menu["main_courses"] = ["Grilled Salmon", "Vegetable Risotto", "Gluten-Free Pizza"]
+            restrictions = dietary_restrictions.lower()
+            if "vegetarian" in restrictions:
+                main_courses = VEGETARIAN_MAINS
+            if "gluten-free" in restrictions:
+                main_courses = GLUTEN_FREE_MAINS
         
         # Add personalized recommendations
         if preferences.get("likes_spicy"):
-            menu["main_courses"].append("Spicy Arrabbiata Pasta")
+            main_courses += (SPICY_MAIN,)
+        
+        # Only copy the menu when the main courses differ from the base menu
+        menu = BASE_MENU
+        if main_courses is not BASE_MENU["main_courses"]:
+            menu = {**BASE_MENU, "main_courses": main_courses}
         
         return f"Personalized menu for {customer_id}:\n" + \
                "\n".join([f"{category}: {', '.join(items)}" for category, items in menu.items()])
     
     def analyze_customer_sentiment(self, customer_feedback: str) -> str:
         """Analyze customer feedback sentiment and extract insights."""
-        # Mock sentiment analysis
-        positive_words = ["great", "amazing", "delicious", "wonderful", "excellent"]
-        negative_words = ["bad", "terrible", "awful", "disgusting", "poor"]
-        
-        feedback_lower = customer_feedback.lower()
-        positive_count = sum(1 for word in positive_words if word in feedback_lower)
-        negative_count = sum(1 for word in negative_words if word in feedback_lower)
+        # Mock sentiment analysis over whole words, so e.g. "badge" is not "bad"
+        words = set(_WORD_RE.findall(customer_feedback.lower()))
+        positive_count = len(words & POSITIVE_WORDS)
+        negative_count = len(words & NEGATIVE_WORDS)
         
         if positive_count > negative_count:
             sentiment = "positive"
@@ -100,16 +130,12 @@ class LlamaIndexRestaurantTools:
     
     def suggest_upselling_opportunities(self, current_order: str, customer_id: str) -> str:
         """Suggest upselling opportunities based on current order and customer history."""
-        order_lower = current_order.lower()
-        suggestions = []
-        
         # Analyze order for upselling opportunities
-        if "pizza" in order_lower:
-            suggestions.append("Add extra cheese or premium toppings")
-        if "pasta" in order_lower:
-            suggestions.append("Add garlic bread or side salad")
-        if "salad" in order_lower:
-            suggestions.append("Add protein (chicken, shrimp, or salmon)")
+        ordered = set(_UPSELL_RE.findall(current_order.lower()))
+        suggestions = [
+            suggestion for dish, suggestion in UPSELL_SUGGESTIONS.items()
+            if dish in ordered
+        ]
         
         # Check customer history for preferences
         preferences = self.customer_preferences.get(customer_id, {})
@@ -125,31 +151,35 @@ class LlamaIndexRestaurantTools:
 class LlamaIndexRestaurantAgent:
     """Restaurant agent powered by LlamaIndex with ACP compliance."""
     
+    # (method name, description) of the LlamaIndexRestaurantTools exposed to the LLM
+    TOOL_SPECS = [
+        ("get_menu_recommendations",
+         "Get personalized menu recommendations based on customer preferences and dietary restrictions"),
+        ("analyze_customer_sentiment",
+         "Analyze customer feedback sentiment and extract actionable insights"),
+        ("suggest_upselling_opportunities",
+         "Suggest upselling opportunities based on current order and customer history"),
+    ]
+    
+    # Tool metadata (including the inferred argument schema) is the same for
+    # every agent, so it is built once and shared
+    _tool_metadata: Dict[str, Any] = {}
+    
     def __init__(self, config: ACPConfig, openai_api_key: str):
         self.config = config
         self.tools = LlamaIndexRestaurantTools(config)
         
-        # Initialize LlamaIndex agent
+        # Capability names are fixed per agent, so every query context shares
+        # one immutable copy
+        self._capability_values = tuple(cap.value for cap in config.capabilities)
+        
+        # Initialize LlamaIndex agent. The ReAct agent and every enhanced skill
+        # share this one LLM, which reuses a single OpenAI client (and so one
+        # connection pool) across requests.
         self.llm = OpenAI(model="gpt-4", api_key=openai_api_key)
         
         # Create LlamaIndex tools
-        self.llama_tools = [
-            FunctionTool.from_defaults(
-                fn=self.tools.get_menu_recommendations,
-                name="get_menu_recommendations",
-                description="Get personalized menu recommendations based on customer preferences and dietary restrictions"
-            ),
-            FunctionTool.from_defaults(
-                fn=self.tools.analyze_customer_sentiment,
-                name="analyze_customer_sentiment", 
-                description="Analyze customer feedback sentiment and extract actionable insights"
-            ),
-            FunctionTool.from_defaults(
-                fn=self.tools.suggest_upselling_opportunities,
-                name="suggest_upselling_opportunities",
-                description="Suggest upselling opportunities based on current order and customer history"
-            )
-        ]
+        self.llama_tools = self._create_llama_tools()
         
         # Create LlamaIndex agent
         self.llama_agent = ReActAgent.from_tools(
@@ -164,6 +194,20 @@ class LlamaIndexRestaurantAgent:
         # Add LLM-enhanced skills
         self._setup_enhanced_skills()
     
+    def _create_llama_tools(self) -> List[FunctionTool]:
+        """Wrap this agent's restaurant tools as LlamaIndex function tools."""
+        llama_tools = []
+        for name, description in self.TOOL_SPECS:
+            fn = getattr(self.tools, name)
+            metadata = self._tool_metadata.get(name)
+            if metadata is None:
+                tool = FunctionTool.from_defaults(fn=fn, name=name, description=description)
+                self._tool_metadata[name] = tool.metadata
+            else:
+                tool = FunctionTool.from_defaults(fn=fn, tool_metadata=metadata)
+            llama_tools.append(tool)
+        return llama_tools
+    
     def _setup_enhanced_skills(self):
         """Setup LLM-enhanced ACP skills."""
         # Create enhanced skills with LLM capabilities
@@ -193,20 +237,29 @@ class LlamaIndexRestaurantAgent:
         await self.acp_agent.initialize()
         print(f"🤖 LlamaIndex Restaurant Agent initialized: {self.config.name}")
     
-    async def process_query(self, query: str, customer_id: str = None) -> str:
-        """Process a customer query using LlamaIndex reasoning."""
+    def _build_context(self, customer_id: str = None) -> Dict[str, Any]:
+        """Build the query context for a customer."""
         context = {
             "customer_id": customer_id,
             "restaurant_name": self.config.name,
-            "available_capabilities": [cap.value for cap in self.config.capabilities]
+            "available_capabilities": self._capability_values
         }
         
         # Add customer preferences to context if available
-        if customer_id and customer_id in self.tools.customer_preferences:
-            context["customer_preferences"] = self.tools.customer_preferences[customer_id]
+        preferences = self.tools.customer_preferences.get(customer_id)
+        if preferences is not None:
+            context["customer_preferences"] = preferences
         
-        response = await self.acp_agent.process_query(query, context)
-        return response
+        return context
+    
+    async def process_query(self, query: str, customer_id: str = None) -> str:
+        """Process a customer query using LlamaIndex reasoning."""
+        return await self.acp_agent.process_query(query, self._build_context(customer_id))
+    
+    async def stream_query(self, query: str, customer_id: str = None) -> AsyncIterator[str]:
+        """Process a customer query, yielding the response as it is generated."""
+        async for token in self.acp_agent.stream_query(query, self._build_context(customer_id)):
+            yield token
     
     async def handle_commerce_task(self, task_type: str, task_data: Dict[str, Any]) -> str:
         """Handle commerce tasks through ACP skills."""
@@ -214,7 +267,7 @@ class LlamaIndexRestaurantAgent:
         
         task = CommerceTask(
             task_type=task_type,
-            task_id=f"task_{asyncio.get_event_loop().time()}",
+            task_id=next_task_id(),
             data=task_data
         )
         
@@ -245,20 +298,43 @@ def main(openai_api_key: str, customer_id: str):
         print("\n🧪 Testing LlamaIndex Restaurant Agent:")
         print("=" * 50)
         
-        for i, query in enumerate(test_queries, 1):
+        # The queries are independent, so run them concurrently and report in
+        # order, capping in-flight LLM requests to stay under rate limits.
+        # The task group cancels the remaining queries as soon as one fails
+        # instead of letting them keep spending tokens.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        
+        async def guarded_query(query: str) -> str:
+            async with semaphore:
+                return await agent.process_query(query, customer_id)
+        
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(guarded_query(query)) for query in test_queries]
+        except ExceptionGroup as eg:
+            for error in eg.exceptions:
+                print(f"Error: {error}")
+            print("\n❌ Example aborted, remaining queries were cancelled")
+            return
+        
+        for i, (query, task) in enumerate(zip(test_queries, tasks, strict=True), 1):
             print(f"\n{i}. Query: {query}")
             print("-" * 30)
-            
-            try:
-                response = await agent.process_query(query, customer_id)
-                print(f"Response: {response}")
-            except Exception as e:
-                print(f"Error: {e}")
+            print(f"Response: {task.result()}")
+        
+        # Interactive use streams the answer so the first tokens show up
+        # without waiting for the whole completion
+        print("\n🌊 Streaming a follow-up query:")
+        print("-" * 30)
+        async for token in agent.stream_query("Any dessert suggestions to finish the meal?", customer_id):
+            print(token, end="", flush=True)
+        print()
         
         print("\n✅ Example completed!")
     
     # Run the example
-    asyncio.run(run_example())
+    with asyncio.Runner(loop_factory=LOOP_FACTORY) as runner:
+        runner.run(run_example())
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List
 
+from example_utils import LOOP_FACTORY
 from acp_sdk import (
     ACPAgent,
     OrderManagementSkill,
@@ -27,6 +28,11 @@ from acp_sdk import (
     OfferDetails,
 )
 
+# Dinner Special (ofr_002): $2.50 back on orders over $25
+DINNER_OFFER_MINIMUM = Decimal("25.00")
+DINNER_OFFER_CASHBACK = Decimal("2.50")
+DINNER_OFFER_EXPIRY = datetime(2025, 12, 31, 23, 59, 59)  # Set actual expiry
+
 
 class OttoPortlandOrderSkill(OrderManagementSkill):
     """OTTO Portland's custom order management implementation."""
@@ -41,7 +47,7 @@ class OttoPortlandOrderSkill(OrderManagementSkill):
     async def _create_order(self, task) -> OrderSummary:
         """Create an order with OTTO Portland's business logic."""
         # Calculate subtotal
-        subtotal = sum(item.total for item in task.items)
+        subtotal = sum((item.total for item in task.items), Decimal(0))
         
         # Apply minimum order validation
         if subtotal < self.minimum_order:
@@ -87,19 +93,19 @@ class OttoPortlandOrderSkill(OrderManagementSkill):
         """Apply OTTO Portland's offers."""
         # OTTO Portland specific offer logic
         if offer_id == "ofr_002":  # Dinner offer
-            subtotal = sum(item.total for item in items)
-            if subtotal >= Decimal("25.00"):
-                        return OfferDetails(
-            offer_id=offer_id,
-            title="Dinner Special",
-            description="$2.50 back on orders over $25",
-            discount_type="cashback",
-            discount_value=Decimal("2.50"),
-            minimum_spend=Decimal("25.00"),
-            valid_until=datetime(2025, 12, 31, 23, 59, 59),  # Set actual expiry
-            restrictions=[],
-            applicable_items=[]
-        )
+            subtotal = sum((item.total for item in items), Decimal(0))
+            if subtotal >= DINNER_OFFER_MINIMUM:
+                return OfferDetails(
+                    offer_id=offer_id,
+                    title="Dinner Special",
+                    description="$2.50 back on orders over $25",
+                    discount_type="cashback",
+                    discount_value=DINNER_OFFER_CASHBACK,
+                    minimum_spend=DINNER_OFFER_MINIMUM,
+                    valid_until=DINNER_OFFER_EXPIRY,
+                    restrictions=[],
+                    applicable_items=[]
+                )
         
         return None
 
@@ -255,4 +261,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=LOOP_FACTORY) as runner:
+        runner.run(main())
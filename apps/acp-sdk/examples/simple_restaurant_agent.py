@@ -7,6 +7,9 @@ using the refactored ACP SDK.
 """
 
 import asyncio
+import itertools
+from collections import OrderedDict
+from example_utils import next_task_id
 from acp_sdk import (
     create_acp_server,
     ACPBaseExecutor,
@@ -25,6 +28,18 @@ from acp_sdk import (
 from decimal import Decimal
 from datetime import datetime
 
+TAX_RATE = Decimal('0.08')  # 8% tax
+
+# Most orders/payments each skill keeps in memory before dropping the oldest
+MAX_STORED_RECORDS = 10_000
+
+
+def _store(records: OrderedDict, key: str, value) -> None:
+    """Store a record, evicting the oldest once over MAX_STORED_RECORDS."""
+    records[key] = value
+    if len(records) > MAX_STORED_RECORDS:
+        records.popitem(last=False)
+
 
 class SimpleRestaurantSkill(OrderManagementSkill):
     """Simple restaurant-specific order management skill."""
@@ -32,16 +47,17 @@ class SimpleRestaurantSkill(OrderManagementSkill):
     def __init__(self, config):
         super().__init__()
         self.config = config
-        self.orders = {}  # Simple in-memory order storage
+        self.orders = OrderedDict()  # Simple bounded in-memory order storage
+        self._order_seq = itertools.count(1)
     
     async def _handle_order_task(self, task):
         """Handle order-specific tasks."""
         # Generate order ID
-        order_id = f"ord_{self.config.agent_id}_{len(self.orders) + 1}"
+        order_id = f"ord_{self.config.agent_id}_{next(self._order_seq)}"
         
         # Calculate totals
-        subtotal = sum(item.total for item in task.items)
-        tax = subtotal * Decimal('0.08')  # 8% tax
+        subtotal = sum((item.total for item in task.items), Decimal(0))
+        tax = subtotal * TAX_RATE
         total = subtotal + tax
         
         # Create order summary
@@ -57,7 +73,7 @@ class SimpleRestaurantSkill(OrderManagementSkill):
         )
         
         # Store order
-        self.orders[order_id] = order
+        _store(self.orders, order_id, order)
         
         return OrderResult(
             task_id=task.task_id,
@@ -73,12 +89,13 @@ class SimplePaymentSkill(PaymentProcessingSkill):
     def __init__(self, config):
         super().__init__()
         self.config = config
-        self.payments = {}  # Simple in-memory payment storage
+        self.payments = OrderedDict()  # Simple bounded in-memory payment storage
+        self._payment_seq = itertools.count(1)
     
     async def _process_payment(self, payment_request):
         """Process a restaurant payment."""
         # Generate payment ID
-        payment_id = f"pay_{self.config.agent_id}_{len(self.payments) + 1}"
+        payment_id = f"pay_{self.config.agent_id}_{next(self._payment_seq)}"
         
         # Mock payment processing
         payment_result = PaymentDetails(
@@ -90,10 +107,10 @@ class SimplePaymentSkill(PaymentProcessingSkill):
         )
         
         # Store payment
-        self.payments[payment_id] = payment_result
+        _store(self.payments, payment_id, payment_result)
         
         return PaymentResult(
-            task_id=f"task_{datetime.now().timestamp()}",
+            task_id=next_task_id(),
             success=True,
             data={"payment_id": payment_id},
             payment=payment_result
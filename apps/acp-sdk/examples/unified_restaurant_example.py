@@ -7,6 +7,8 @@ go through ACP skills with merchant-specific customization.
 """
 
 import asyncio
+import itertools
+from example_utils import next_task_id
 from acp_sdk import (
     create_acp_server,
     ACPBaseExecutor,
@@ -21,10 +23,20 @@ from acp_sdk import (
     PaymentDetails,
     OrderStatus,
     PaymentStatus,
+    PaymentMethod,
 )
 from decimal import Decimal
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
 
+ZERO = Decimal('0.00')
+TAX_RATE = Decimal('0.08')  # 8% tax
+DELIVERY_FEE = Decimal('5.00')
+FREE_DELIVERY_THRESHOLD = Decimal(30)
+CREDIT_CARD_SERVICE_FEE_RATE = Decimal('0.02')
+
+_item_total = attrgetter('total')
 
 class UnifiedRestaurantOrderSkill(OrderManagementSkill):
     """Unified restaurant order management skill."""
@@ -33,19 +45,20 @@ class UnifiedRestaurantOrderSkill(OrderManagementSkill):
         super().__init__()
         self.config = config
         self.orders = {}
+        self._order_seq = itertools.count(1)
     
     async def _handle_order_task(self, task):
         """Handle order-specific tasks with custom business logic."""
         # Generate order ID
-        order_id = f"unified_{self.config.agent_id}_{len(self.orders) + 1}"
+        order_id = f"unified_{self.config.agent_id}_{next(self._order_seq)}"
         
         # Calculate totals with custom business rules
-        subtotal = sum(item.total for item in task.items)
+        subtotal = sum(map(_item_total, task.items), ZERO)
         
         # Custom business rule: Free delivery for orders over $30
-        delivery_fee = Decimal('0.00') if subtotal > 30 else Decimal('5.00')
+        delivery_fee = ZERO if subtotal > FREE_DELIVERY_THRESHOLD else DELIVERY_FEE
         
-        tax = subtotal * Decimal('0.08')  # 8% tax
+        tax = subtotal * TAX_RATE
         total = subtotal + tax + delivery_fee
         
         # Create order summary
@@ -79,16 +92,17 @@ class UnifiedRestaurantPaymentSkill(PaymentProcessingSkill):
         super().__init__()
         self.config = config
         self.payments = {}
+        self._payment_seq = itertools.count(1)
     
     async def _process_payment(self, payment_request):
         """Process payment with custom business logic."""
         # Generate payment ID
-        payment_id = f"unified_pay_{self.config.agent_id}_{len(self.payments) + 1}"
+        payment_id = f"unified_pay_{self.config.agent_id}_{next(self._payment_seq)}"
         
         # Custom business rule: Add 2% service fee for credit card payments
-        service_fee = Decimal('0.00')
-        if payment_request.payment_method.value == "credit_card":
-            service_fee = payment_request.amount * Decimal('0.02')
+        service_fee = ZERO
+        if payment_request.payment_method is PaymentMethod.CREDIT_CARD:
+            service_fee = payment_request.amount * CREDIT_CARD_SERVICE_FEE_RATE
         
         # Mock payment processing
         payment_result = PaymentDetails(
@@ -103,7 +117,7 @@ class UnifiedRestaurantPaymentSkill(PaymentProcessingSkill):
         self.payments[payment_id] = payment_result
         
         return PaymentResult(
-            task_id=f"task_{datetime.now().timestamp()}",
+            task_id=next_task_id(),
             success=True,
             data={"payment_id": payment_id, "service_fee": service_fee},
             payment=payment_result
@@ -113,77 +127,73 @@ class UnifiedRestaurantPaymentSkill(PaymentProcessingSkill):
 class UnifiedRestaurantOfferSkill(OfferManagementSkill):
     """Unified restaurant offer management skill."""
     
+    # Offer rules are the same for every skill instance, so they are shared
+    offers = {
+        "welcome_discount": {
+            "title": "Welcome Discount",
+            "description": "10% off your first order",
+            "discount": Decimal('0.10'),
+            "min_order": Decimal('15.00'),
+            "max_discount": Decimal('10.00')
+        },
+        "lunch_rush": {
+            "title": "Lunch Rush Special",
+            "description": "15% off lunch orders",
+            "discount": Decimal('0.15'),
+            "valid_hours": (11, 14)  # 11 AM to 2 PM
+        }
+    }
+    
     def __init__(self, config):
         super().__init__()
         self.config = config
-        self.offers = {
-            "welcome_discount": {
-                "title": "Welcome Discount",
-                "description": "10% off your first order",
-                "discount": Decimal('0.10'),
-                "min_order": Decimal('15.00'),
-                "max_discount": Decimal('10.00')
-            },
-            "lunch_rush": {
-                "title": "Lunch Rush Special",
-                "description": "15% off lunch orders",
-                "discount": Decimal('0.15'),
-                "valid_hours": (11, 14)  # 11 AM to 2 PM
-            }
+        # Offer-specific business rules; offers without one get a plain discount
+        self._offer_rules = {
+            "welcome_discount": self._apply_welcome_discount,
+            "lunch_rush": self._apply_lunch_rush,
         }
     
+    def _apply_welcome_discount(self, offer, subtotal):
+        """Welcome discount: minimum order amount, discount capped at a maximum."""
+        if subtotal < offer["min_order"]:
+            return ZERO, f"Minimum order of ${offer['min_order']} required"
+        return min(subtotal * offer["discount"], offer["max_discount"]), None
+    
+    def _apply_lunch_rush(self, offer, subtotal):
+        """Lunch rush special: only valid during lunch hours."""
+        start_hour, end_hour = offer["valid_hours"]
+        if not (start_hour <= datetime.now().hour <= end_hour):
+            return ZERO, "Lunch rush special only valid 11 AM - 2 PM"
+        return subtotal * offer["discount"], None
+    
+    def _apply_discount(self, offer, subtotal):
+        """Default rule: apply the offer's discount rate."""
+        return subtotal * offer["discount"], None
+    
     async def _validate_offer(self, offer_id: str, items: list):
         """Validate offer with custom business rules."""
-        if offer_id not in self.offers:
+        offer = self.offers.get(offer_id)
+        if offer is None:
             return OfferValidationResult(
-                task_id=f"task_{datetime.now().timestamp()}",
+                task_id=next_task_id(),
                 success=True,
                 is_valid=False,
-                discount_amount=Decimal('0.00'),
+                discount_amount=ZERO,
                 restrictions_violated=["Offer not found"]
             )
         
-        offer = self.offers[offer_id]
-        subtotal = sum(item.total for item in items)
+        subtotal = sum(map(_item_total, items), ZERO)
         
         # Custom business rules
-        if offer_id == "welcome_discount":
-            # Check minimum order amount
-            if subtotal < offer["min_order"]:
-                return OfferValidationResult(
-                    task_id=f"task_{datetime.now().timestamp()}",
-                    success=True,
-                    is_valid=False,
-                    discount_amount=Decimal('0.00'),
-                    restrictions_violated=[f"Minimum order of ${offer['min_order']} required"]
-                )
-            
-            # Calculate discount with maximum cap
-            discount_amount = min(subtotal * offer["discount"], offer["max_discount"])
-            
-        elif offer_id == "lunch_rush":
-            # Check if current time is within lunch hours
-            current_hour = datetime.now().hour
-            if not (offer["valid_hours"][0] <= current_hour <= offer["valid_hours"][1]):
-                return OfferValidationResult(
-                    task_id=f"task_{datetime.now().timestamp()}",
-                    success=True,
-                    is_valid=False,
-                    discount_amount=Decimal('0.00'),
-                    restrictions_violated=["Lunch rush special only valid 11 AM - 2 PM"]
-                )
-            
-            discount_amount = subtotal * offer["discount"]
-        
-        else:
-            discount_amount = subtotal * offer["discount"]
+        apply_rule = self._offer_rules.get(offer_id, self._apply_discount)
+        discount_amount, violation = apply_rule(offer, subtotal)
         
         return OfferValidationResult(
-            task_id=f"task_{datetime.now().timestamp()}",
+            task_id=next_task_id(),
             success=True,
-            is_valid=True,
+            is_valid=violation is None,
             discount_amount=discount_amount,
-            restrictions_violated=[]
+            restrictions_violated=[] if violation is None else [violation]
         )
 
 
@@ -198,9 +208,14 @@ class UnifiedRestaurantExecutor(ACPBaseExecutor):
             UnifiedRestaurantOfferSkill(self.config)
         ]
     
+    @cached_property
+    def _welcome_message(self) -> str:
+        """Greeting for general conversation, built once per executor."""
+        return f"Welcome to {self.config.name}! I can help you with orders, payments, and offers. We have special business rules like free delivery on orders over $30 and lunch rush discounts!"
+    
     async def _handle_general_conversation(self, query: str, context_id: str) -> str:
         """Handle general conversation with restaurant-specific responses."""
-        return f"Welcome to {self.config.name}! I can help you with orders, payments, and offers. We have special business rules like free delivery on orders over $30 and lunch rush discounts!"
+        return self._welcome_message
 
 
 def main():
@@ -3,168 +3,100 @@ ACP SDK - Standardized commerce capabilities for ACP protocol.
 
 This package provides a complete framework for creating ACP-compliant services
 with standardized commerce capabilities while maintaining compliance with the ACP protocol.
+
+Exports are loaded lazily on first access, so importing the package (or a
+single model from it) does not pull in every subsystem and its dependencies.
 """
 
-# Transaction processing module
-from .txns import WalletManager, PrivacyManager, create_txn_simulator_app
-
-# Discovery module
-from .discovery import GORClient, OfferRegistry, VectorSearchService, OSFIngestionService
-
-# MCP module
-from .mcp import mcp, main as mcp_main, ACPClient
-
-# A2A module - Core functionality for restaurant agents
-from .a2a import (
-    # Core classes
-    ACPAgent,
-    ACPBaseExecutor,
-    ACPServer,
-    create_acp_server,
-    
-    # Configuration and models
-    ACPConfig,
-    AgentCapability,
-    
-    # Task models
-    CommerceTask,
-    CommerceResult,
-    OrderTask,
-    PaymentTask,
-    OfferTask,
-    InventoryTask,
-    CustomerServiceTask,
-    OrderResult,
-    PaymentResult,
-    OfferValidationResult,
-    InventoryResult,
-    CustomerServiceResult,
-    
-    # Data models
-    OrderItem,
-    OrderSummary,
-    OfferDetails,
-    PaymentRequest,
-    PaymentDetails,
-    
-    # Enums
-    TaskType,
-    OrderStatus,
-    PaymentStatus,
-    PaymentMethod,
-    
-    # Skills
-    BaseCommerceSkill,
-    OrderManagementSkill,
-    PaymentProcessingSkill,
-    OfferManagementSkill,
-    InventoryManagementSkill,
-    CustomerServiceSkill,
-    CommerceSkills,
-    LLMEnhancedSkill,
-    LLMEnhancedOrderSkill,
-    LLMEnhancedPaymentSkill,
-    
-    # Exceptions
-    ACPError,
-    ConfigurationError,
-    SkillExecutionError,
-    ValidationError,
-    HITLRequiredError,
-)
-
-# Models
-from .models.offers import Offer, SearchOffersInput, GetOfferByIdInput, NearbyOffersInput
-from .models.receipts import CreateReceiptRequest, CreateReceiptResponse, AttributionReceipt
-from .models.postbacks import ProcessPostbackRequest, ProcessPostbackResponse, SettlementPostback
-from .models.wallets import WalletResponse, ProtocolStats
+from ._lazy import attach as _attach, exports as _exports, pin as _pin
 
 __version__ = "1.0.0"
 
-__all__ = [
-    # Transaction processing
-    "WalletManager",
-    "PrivacyManager",
-    "create_txn_simulator_app",
-    
-    # Discovery
-    "GORClient",
-    "OfferRegistry", 
-    "VectorSearchService",
-    "OSFIngestionService",
-    
-    # MCP
-    "mcp",
-    "mcp_main",
-    "ACPClient",
-    
-    # A2A Core classes
-    "ACPAgent",
-    "ACPBaseExecutor",
-    "ACPServer",
-    "create_acp_server",
-    
-    # A2A Configuration and models
-    "ACPConfig",
-    "AgentCapability",
-    
-    # A2A Task models
-    "CommerceTask",
-    "CommerceResult",
-    "OrderTask",
-    "PaymentTask",
-    "OfferTask",
-    "InventoryTask",
-    "CustomerServiceTask",
-    "OrderResult",
-    "PaymentResult",
-    "OfferValidationResult",
-    "InventoryResult",
-    "CustomerServiceResult",
-    
-    # A2A Data models
-    "OrderItem",
-    "OrderSummary",
-    "OfferDetails",
-    "PaymentRequest",
-    "PaymentDetails",
-    
-    # A2A Enums
-    "TaskType",
-    "OrderStatus",
-    "PaymentStatus",
-    "PaymentMethod",
-    
-    # A2A Skills
-    "BaseCommerceSkill",
-    "OrderManagementSkill",
-    "PaymentProcessingSkill",
-    "OfferManagementSkill",
-    "InventoryManagementSkill",
-    "CustomerServiceSkill",
-    "CommerceSkills",
-    "LLMEnhancedSkill",
-    "LLMEnhancedOrderSkill",
-    "LLMEnhancedPaymentSkill",
-    
-    # A2A Exceptions
-    "ACPError",
-    "ConfigurationError",
-    "SkillExecutionError",
-    "ValidationError",
-    "HITLRequiredError",
-    
+
+# Exported name -> (module relative to this package, attribute in that module)
+_LAZY_IMPORTS = {
+    # Transaction processing module
+    **_exports(".txns", "WalletManager", "PrivacyManager", "create_txn_simulator_app"),
+
+    # Discovery module
+    **_exports(".discovery", "GORClient", "OfferRegistry", "VectorSearchService", "OSFIngestionService"),
+
+    # MCP module
+    "mcp": (".mcp", "mcp"),
+    "mcp_main": (".mcp", "main"),
+    "ACPClient": (".mcp", "ACPClient"),
+
+    # A2A module - Core functionality for restaurant agents
+    **_exports(
+        ".a2a",
+        # Core classes
+        "ACPAgent",
+        "ACPBaseExecutor",
+        "ACPServer",
+        "create_acp_server",
+
+        # Configuration and models
+        "ACPConfig",
+        "AgentCapability",
+
+        # Task models
+        "CommerceTask",
+        "CommerceResult",
+        "OrderTask",
+        "PaymentTask",
+        "OfferTask",
+        "InventoryTask",
+        "CustomerServiceTask",
+        "OrderResult",
+        "PaymentResult",
+        "OfferValidationResult",
+        "InventoryResult",
+        "CustomerServiceResult",
+
+        # Data models
+        "OrderItem",
+        "OrderSummary",
+        "OfferDetails",
+        "PaymentRequest",
+        "PaymentDetails",
+
+        # Enums
+        "TaskType",
+        "OrderStatus",
+        "PaymentStatus",
+        "PaymentMethod",
+
+        # Skills
+        "BaseCommerceSkill",
+        "OrderManagementSkill",
+        "PaymentProcessingSkill",
+        "OfferManagementSkill",
+        "InventoryManagementSkill",
+        "CustomerServiceSkill",
+        "CommerceSkills",
+        "LLMEnhancedSkill",
+        "LLMEnhancedOrderSkill",
+        "LLMEnhancedPaymentSkill",
+
+        # Exceptions
+        "ACPError",
+        "ConfigurationError",
+        "SkillExecutionError",
+        "ValidationError",
+        "HITLRequiredError",
+    ),
+
     # Models
-    "Offer",
-    "SearchOffersInput",
-    "GetOfferByIdInput", 
-    "NearbyOffersInput",
-    "CreateReceiptRequest",
-    "CreateReceiptResponse",
-    "AttributionReceipt",
-    "ProcessPostbackRequest",
-    "ProcessPostbackResponse",
-    "SettlementPostback",
-    "WalletResponse",
-    "ProtocolStats",
-]
+    **_exports(".models.offers", "Offer", "SearchOffersInput", "GetOfferByIdInput", "NearbyOffersInput"),
+    **_exports(".models.receipts", "CreateReceiptRequest", "CreateReceiptResponse", "AttributionReceipt"),
+    **_exports(".models.postbacks", "ProcessPostbackRequest", "ProcessPostbackResponse", "SettlementPostback"),
+    **_exports(".models.wallets", "WalletResponse", "ProtocolStats"),
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = _attach(globals(), _LAZY_IMPORTS)
+
+# The MCP server shares its name with the acp_sdk.mcp subpackage, which would
+# shadow it as soon as any acp_sdk.mcp submodule is imported
+_pin(globals(), __getattr__, "mcp")
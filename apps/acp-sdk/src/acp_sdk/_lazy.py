@@ -0,0 +1,80 @@
+"""
+Lazy (PEP 562) package exports.
+
+Packages declare which module defines each exported name, and the name is
+imported on first attribute access instead of when the package is imported.
+"""
+
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+LazyImports = Dict[str, Tuple[str, str]]
+
+
+def exports(module: str, *names: str) -> LazyImports:
+    """Map each exported name to the same attribute of ``module``."""
+    return {name: (module, name) for name in names}
+
+
+def attach(
+    package_globals: Dict[str, Any], lazy_imports: LazyImports
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package_globals: The package's ``globals()``, where loaded names are cached
+        lazy_imports: Exported name -> (module relative to the package, attribute)
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package
+    """
+    package = package_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name, attr = lazy_imports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        value = getattr(import_module(module_name, package), attr)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(lazy_imports))
+
+    return __getattr__, __dir__
+
+
+def pin(package_globals: Dict[str, Any], getattr_: Callable[[str], Any], *names: str) -> None:
+    """
+    Keep lazy exports that share their name with a subpackage.
+
+    Importing a submodule binds it as an attribute of its parent package, which
+    would shadow a lazy export of the same name. The pinned names become
+    properties of the package's module class instead, so they always resolve
+    to the export and the import system's binding is ignored.
+
+    Args:
+        package_globals: The package's ``globals()``
+        getattr_: The package's lazy ``__getattr__`` from ``attach()``
+        names: Exported names that clash with subpackages
+    """
+    def export(name: str) -> property:
+        def get(module: ModuleType) -> Any:
+            return getattr_(name)
+
+        def set(module: ModuleType, value: Any) -> None:
+            # Submodule binding by the import system; the subpackage stays
+            # reachable through sys.modules
+            pass
+
+        return property(get, set)
+
+    module = sys.modules[package_globals["__name__"]]
+    module.__class__ = type(
+        f"_{module.__name__}_package", (ModuleType,), {name: export(name) for name in names}
+    )
@@ -6,14 +6,21 @@ with the ACP SDK to create true AI agents with reasoning capabilities.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
 from abc import ABC, abstractmethod
 
+import orjson
+
 from ..models.a2a_connector import ACPConfig, CommerceTask, CommerceResult
 from .core import ACPAgent
 from .skills import BaseCommerceSkill
 
 
+def _format_context(context: Dict[str, Any]) -> str:
+    """Render query context as JSON for embedding in an agent prompt."""
+    return orjson.dumps(context, default=str).decode()
+
+
 class AgentFrameworkAdapter(ABC):
     """
     Abstract base class for integrating agent frameworks with ACP SDK.
@@ -37,6 +44,14 @@ class AgentFrameworkAdapter(ABC):
         """Process a query using the agent framework."""
         pass
         
+    async def stream_query(self, query: str, context: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Process a query, yielding the response in chunks as it is generated.
+        
+        Frameworks without streaming support yield the full response once.
+        """
+        yield await self.process_query(query, context)
+        
     @abstractmethod
     async def execute_commerce_task(self, task: CommerceTask) -> CommerceResult:
         """Execute a commerce task through the agent framework."""
@@ -132,23 +147,33 @@ class LlamaIndexACPAdapter(AgentFrameworkAdapter):
         """Initialize LlamaIndex agent."""
         self.framework_agent = self.llama_agent
         
-    async def process_query(self, query: str, context: Dict[str, Any]) -> str:
-        """Process query through LlamaIndex."""
-        if not self.framework_agent:
-            await self.initialize()
-            
-        # Add context to query
-        enhanced_query = f"""
-        Context: {context}
+    def _build_query(self, query: str, context: Dict[str, Any]) -> str:
+        """Add context to a query for the LlamaIndex agent."""
+        return f"""
+        Context: {_format_context(context)}
         Query: {query}
         
         Please help with this request using the available tools.
         """
         
+    async def process_query(self, query: str, context: Dict[str, Any]) -> str:
+        """Process query through LlamaIndex."""
+        if not self.framework_agent:
+            await self.initialize()
+        
         # Execute LlamaIndex agent
-        response = await self.framework_agent.achat(enhanced_query)
+        response = await self.framework_agent.achat(self._build_query(query, context))
         return str(response)
         
+    async def stream_query(self, query: str, context: Dict[str, Any]) -> AsyncIterator[str]:
+        """Process query through LlamaIndex, yielding tokens as they arrive."""
+        if not self.framework_agent:
+            await self.initialize()
+        
+        response = await self.framework_agent.astream_chat(self._build_query(query, context))
+        async for token in response.async_response_gen():
+            yield token
+        
     async def execute_commerce_task(self, task: CommerceTask) -> CommerceResult:
         """Execute commerce task through LlamaIndex."""
         # Convert ACP task to LlamaIndex tool call
@@ -206,7 +231,7 @@ class AutoGenACPAdapter(AgentFrameworkAdapter):
         """Process query through AutoGen."""
         # Create chat with context
         enhanced_query = f"""
-        Context: {context}
+        Context: {_format_context(context)}
         User Query: {query}
         """
         
@@ -271,6 +296,14 @@ class ACPAgentFrameworkExecutor:
             
         return await self.framework_adapter.process_query(query, context)
         
+    async def stream_query(self, query: str, context: Dict[str, Any] = None) -> AsyncIterator[str]:
+        """Process a query using the agent framework, streaming the response."""
+        if context is None:
+            context = {}
+            
+        async for chunk in self.framework_adapter.stream_query(query, context):
+            yield chunk
+        
     async def execute_commerce_task(self, task: CommerceTask) -> CommerceResult:
         """Execute a commerce task through the agent framework."""
         return await self.framework_adapter.execute_commerce_task(task)
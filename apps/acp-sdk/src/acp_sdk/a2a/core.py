@@ -17,6 +17,15 @@ from .skills import CommerceSkills, BaseCommerceSkill
 
 logger = logging.getLogger(__name__)
 
+# Map task types to the IDs of the skills that handle them
+_SKILL_MAPPING = {
+    "order_food": "acp_order_management",
+    "validate_offer": "acp_offer_management",
+    "process_payment": "acp_payment_processing",
+    "track_order": "acp_customer_service",
+    "get_menu": "acp_inventory_management",
+}
+
 
 class ACPAgent:
     """
@@ -50,10 +59,24 @@ class ACPAgent:
             for skill in custom_skills:
                 self.commerce_skills.add_skill(skill)
         
+        # Agent card built from the current skills, with the skill registry
+        # version it was built from
+        self._cached_card: Optional[AgentCard] = None
+        self._cached_card_version = -1
+        
         logger.info(f"ACP Agent initialized: {self.name} ({self.agent_id})")
     
     def get_agent_card(self) -> AgentCard:
-        """Generate A2A agent card with ACP capabilities."""
+        """
+        Generate A2A agent card with ACP capabilities.
+        
+        The card is built once and reused until skills are added to or removed
+        from the skill registry. The returned card is shared between callers
+        and must be treated as read-only; use ``model_copy()`` to modify it.
+        """
+        if self._cached_card is not None and self._cached_card_version == self.commerce_skills.version:
+            return self._cached_card
+        
         # Convert ACP skills to A2A format
         a2a_skills = self.commerce_skills.to_a2a_format()
         
@@ -69,6 +92,8 @@ class ACPAgent:
             skills=a2a_skills,
         )
         
+        self._cached_card = agent_card
+        self._cached_card_version = self.commerce_skills.version
         return agent_card
     
     async def execute_commerce_task(self, task: CommerceTask) -> CommerceResult:
@@ -103,18 +128,7 @@ class ACPAgent:
     
     def _get_skill_id_for_task(self, task: CommerceTask) -> Optional[str]:
         """Determine which skill should handle the given task."""
-        task_type = task.task_type
-        
-        # Map task types to skill IDs
-        skill_mapping = {
-            "order_food": "acp_order_management",
-            "validate_offer": "acp_offer_management",
-            "process_payment": "acp_payment_processing",
-            "track_order": "acp_customer_service",
-            "get_menu": "acp_inventory_management",
-        }
-        
-        return skill_mapping.get(task_type)
+        return _SKILL_MAPPING.get(task.task_type)
     
     def add_custom_skill(self, skill: BaseCommerceSkill):
         """Add a custom commerce skill to the agent."""
@@ -123,8 +137,7 @@ class ACPAgent:
     
     def remove_skill(self, skill_id: str):
         """Remove a skill from the agent."""
-        if skill_id in self.commerce_skills.skills:
-            del self.commerce_skills.skills[skill_id]
+        if self.commerce_skills.remove_skill(skill_id):
             logger.info(f"Removed skill: {skill_id}")
         else:
             logger.warning(f"Skill not found: {skill_id}")
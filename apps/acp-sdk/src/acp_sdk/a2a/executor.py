@@ -217,7 +217,7 @@ class ACPBaseExecutor(AgentExecutor):
             is_structured = (
                 isinstance(task_data, dict) and
                 "operation" in task_data and
-                task_data["operation"] in ["order_food", "validate_offer", "process_payment", "get_menu"]
+                task_data["operation"] in ["order_food", "validate_offer", "process_payment", "get_menu", "batch"]
             )
             return is_structured
         except (json.JSONDecodeError, TypeError):
@@ -227,42 +227,55 @@ class ACPBaseExecutor(AgentExecutor):
         """Handle structured ACP tasks from A2A client."""
         try:
             task_data = json.loads(query)
-            operation = task_data.get("operation")
-            
-            logger.info(f"Handling structured ACP task: {operation}")
-            
-            if operation == "get_menu":
-                return await self._get_menu_structured()
-            
-            elif operation == "order_food":
-                items = task_data.get("items", [])
-                offer_id = task_data.get("offer_id")
-                pickup = task_data.get("pickup", True)
-                delivery_address = task_data.get("delivery_address")
-                special_instructions = task_data.get("special_instructions")
-                
-                return await self._create_order_structured(items, offer_id, pickup, delivery_address, special_instructions)
-            
-            elif operation == "validate_offer":
-                offer_id = task_data.get("offer_id", "default")
-                items = task_data.get("items", [])
-                return await self._validate_offer_structured(offer_id, items)
-            
-            elif operation == "process_payment":
-                order_id = task_data.get("order_id", "unknown")
-                amount = task_data.get("amount", 0.0)
-                payment_method = task_data.get("payment_method", "credit_card")
-                payment_details = task_data.get("payment_details", {})
-                
-                return await self._process_payment_structured(order_id, amount, payment_method, payment_details)
-            
-            else:
-                return f"ACP operation '{operation}' not supported by {self.config.name}"
+            return await self._run_structured_acp_task(task_data)
                 
         except Exception as e:
             logger.error(f"Error handling structured ACP task: {e}")
             return f"Error processing ACP task: {str(e)}"
 
+    async def _run_structured_acp_task(self, task_data: Dict[str, Any]) -> str:
+        """Run a parsed structured ACP task and return its response text."""
+        operation = task_data.get("operation")
+        
+        logger.info(f"Handling structured ACP task: {operation}")
+        
+        if operation == "batch":
+            # Composite task: run each step in order and return all results in one
+            # response. Step responses are passed through as text so the client
+            # decodes them exactly like single-operation responses
+            results = []
+            for step in task_data.get("steps", []):
+                results.append(await self._run_structured_acp_task(step))
+            return json.dumps({"results": results})
+        
+        if operation == "get_menu":
+            return await self._get_menu_structured()
+        
+        elif operation == "order_food":
+            items = task_data.get("items", [])
+            offer_id = task_data.get("offer_id")
+            pickup = task_data.get("pickup", True)
+            delivery_address = task_data.get("delivery_address")
+            special_instructions = task_data.get("special_instructions")
+            
+            return await self._create_order_structured(items, offer_id, pickup, delivery_address, special_instructions)
+        
+        elif operation == "validate_offer":
+            offer_id = task_data.get("offer_id", "default")
+            items = task_data.get("items", [])
+            return await self._validate_offer_structured(offer_id, items)
+        
+        elif operation == "process_payment":
+            order_id = task_data.get("order_id", "unknown")
+            amount = task_data.get("amount", 0.0)
+            payment_method = task_data.get("payment_method", "credit_card")
+            payment_details = task_data.get("payment_details", {})
+            
+            return await self._process_payment_structured(order_id, amount, payment_method, payment_details)
+        
+        else:
+            return f"ACP operation '{operation}' not supported by {self.config.name}"
+
     async def _handle_acp_operation(self, query: str, updater: TaskUpdater) -> Optional[str]:
         """Handle ACP commerce operations using ACP skills."""
         try:
@@ -413,6 +413,8 @@ class CommerceSkills:
     
     def __init__(self):
         self.skills: Dict[str, BaseCommerceSkill] = {}
+        # Bumped whenever skills are added or removed, so cached views can tell they are stale
+        self.version = 0
         self._initialize_default_skills()
     
     def _initialize_default_skills(self):
@@ -427,6 +429,14 @@ class CommerceSkills:
         """Add a commerce skill."""
         skill_id = f"acp_{skill.skill_name.lower().replace(' ', '_')}"
         self.skills[skill_id] = skill
+        self.version += 1
+    
+    def remove_skill(self, skill_id: str) -> bool:
+        """Remove a skill by ID, returning whether it was registered."""
+        if self.skills.pop(skill_id, None) is None:
+            return False
+        self.version += 1
+        return True
     
     def get_skill(self, skill_id: str) -> Optional[BaseCommerceSkill]:
         """Get a skill by ID."""
@@ -3,36 +3,81 @@ ACP MCP Server - Universal commerce MCP server for ACP-compliant merchants.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
+from pydantic import TypeAdapter
 from mcp.types import TextContent
 
-from .a2a_client import ACPClient
-from .a2a_client import (
-    CommerceRequest,
-    CommerceResponse,
-    MerchantInfo,
+from .a2a_client import ACPClient, close_shared_http_client
+from ..models.mcp_connector import (
+    CommerceOperation,
+    OrderItem,
     OrderRequest,
     PaymentRequest,
     OfferValidationRequest,
 )
-from ..models.mcp_connector import OrderItem, MerchantDiscovery
 from ..discovery.gor_client import GORClient
 from ..models.offers import (
     SearchOffersInput,
     GetOfferByIdInput,
     NearbyOffersInput,
-    SearchResponse,
-    Offer,
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release pooled A2A connections when the MCP server shuts down."""
+    try:
+        yield
+    finally:
+        await close_shared_http_client()
+
+
+# Demo merchants recognised by name in offer descriptions, as (name, merchant_id)
+_KNOWN_MERCHANTS = (
+    ("OTTO Portland", "otto_portland"),
+    ("Street Exeter", "street_exeter"),
+    ("Newick's Lobster House", "newicks_lobster"),
+)
+
+# Validates a whole list of tool-supplied item dicts at once
+_ORDER_ITEMS_ADAPTER = TypeAdapter(List[OrderItem])
+
+# Fixed tool response layouts, filled in with str.format
+_ORDER_PLACED_TEMPLATE = (
+    "✅ Order placed successfully!\n\n"
+    "**Order ID**: {order_id}\n"
+    "**Total**: ${total}\n"
+    "**Status**: {status}\n"
+    "**Merchant**: {merchant_id}\n"
+)
+_PAYMENT_PROCESSED_TEMPLATE = (
+    "✅ Payment processed successfully!\n\n"
+    "**Payment ID**: {payment_id}\n"
+    "**Order ID**: {order_id}\n"
+    "**Amount**: ${amount}\n"
+    "**Status**: {status}\n"
+    "**Method**: {payment_method}\n"
+    "**Merchant**: {merchant_id}\n"
+)
+_ORDER_TRACKING_TEMPLATE = (
+    "📦 Order Tracking\n\n"
+    "**Order ID**: {order_id}\n"
+    "**Merchant**: {merchant_id}\n"
+    "**Status**: Preparing\n"
+    "**Estimated Ready Time**: 2024-01-15T19:30:00Z\n"
+    "**Last Updated**: 2024-01-15T19:15:00Z\n"
+)
+
 # Initialize MCP server
-mcp = FastMCP(name="acp-mcp")
+mcp = FastMCP(name="acp-mcp", lifespan=_lifespan)
 
 # ACP client will be initialized in main() function
 acp_client = None
@@ -42,10 +87,24 @@ try:
     gor_client = GORClient()
     logger.info("GOR client initialized successfully")
 except Exception as e:
-    logger.error(f"Failed to initialize GOR client: {e}")
+    logger.error("Failed to initialize GOR client: %s", e)
     gor_client = None
 
 
+async def _run_commerce_tool(operation: CommerceOperation, *args: Any) -> str:
+    """Dispatch a commerce tool call to its handler with the shared client guard and error handling."""
+    handler, empty_text, failure_text = _COMMERCE_DISPATCH[operation]
+    try:
+        if acp_client is None:
+            return "❌ ACP client not initialized. Please check the server configuration."
+        
+        result = await handler(*args)
+        return result[0].text if result else empty_text
+    except Exception as e:
+        logger.error("Unexpected error in %s: %s", operation.value, e)
+        return f"❌ {failure_text}: {str(e)}"
+
+
 @mcp.tool()
 async def discover_merchants(
     query: Optional[str] = None,
@@ -55,34 +114,11 @@ async def discover_merchants(
     cuisine_type: Optional[str] = None
 ) -> str:
     """Discover ACP-compliant merchants"""
-    try:
-        logger.info(f"Discover merchants called with: query={query}, cuisine_type={cuisine_type}")
-        
-        if acp_client is None:
-            return "❌ ACP client not initialized. Please check the server configuration."
-        
-        # Ensure proper type conversion
-        try:
-            if lat is not None:
-                lat = float(lat)
-            if lng is not None:
-                lng = float(lng)
-            if radius_m is not None:
-                radius_m = int(radius_m)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Parameter conversion failed: {e}")
-            return f"❌ Invalid parameter values. Please provide valid numbers for lat, lng, and radius_m."
-        
-        arguments = {
-            "query": query,
-            "location": {"lat": lat, "lng": lng, "radius_m": radius_m} if lat and lng else {},
-            "cuisine_type": cuisine_type
-        }
-        result = await handle_discover_merchants(arguments)
-        return result[0].text if result else "No merchants found"
-    except Exception as e:
-        logger.error(f"Unexpected error in discover merchants: {e}")
-        return f"❌ Merchant discovery failed: {str(e)}"
+    logger.info("Discover merchants called with: query=%s, cuisine_type=%s", query, cuisine_type)
+    # lat/lng/radius_m are already coerced by FastMCP from the signature types
+    return await _run_commerce_tool(
+        CommerceOperation.DISCOVER_MERCHANTS, query, lat, lng, radius_m, cuisine_type
+    )
 
 
 @mcp.tool()
@@ -95,25 +131,11 @@ async def order_food(
     special_instructions: Optional[str] = None
 ) -> str:
     """Place a food order with an ACP-compliant merchant"""
-    try:
-        logger.info(f"Order food called with: merchant_id={merchant_id}, items_count={len(items)}")
-        
-        if acp_client is None:
-            return "❌ ACP client not initialized. Please check the server configuration."
-        
-        arguments = {
-            "merchant_id": merchant_id,
-            "items": items,
-            "offer_id": offer_id,
-            "pickup": pickup,
-            "delivery_address": delivery_address,
-            "special_instructions": special_instructions
-        }
-        result = await handle_order_food(arguments)
-        return result[0].text if result else "Order failed"
-    except Exception as e:
-        logger.error(f"Unexpected error in order food: {e}")
-        return f"❌ Order failed: {str(e)}"
+    logger.info("Order food called with: merchant_id=%s, items_count=%d", merchant_id, len(items))
+    return await _run_commerce_tool(
+        CommerceOperation.ORDER_FOOD,
+        merchant_id, items, offer_id, pickup, delivery_address, special_instructions
+    )
 
 
 @mcp.tool()
@@ -123,22 +145,8 @@ async def validate_offer(
     items: List[Dict[str, Any]]
 ) -> str:
     """Validate an offer with an ACP-compliant merchant"""
-    try:
-        logger.info(f"Validate offer called with: merchant_id={merchant_id}, offer_id={offer_id}")
-        
-        if acp_client is None:
-            return "❌ ACP client not initialized. Please check the server configuration."
-        
-        arguments = {
-            "merchant_id": merchant_id,
-            "offer_id": offer_id,
-            "items": items
-        }
-        result = await handle_validate_offer(arguments)
-        return result[0].text if result else "Offer validation failed"
-    except Exception as e:
-        logger.error(f"Unexpected error in validate offer: {e}")
-        return f"❌ Offer validation failed: {str(e)}"
+    logger.info("Validate offer called with: merchant_id=%s, offer_id=%s", merchant_id, offer_id)
+    return await _run_commerce_tool(CommerceOperation.VALIDATE_OFFER, merchant_id, offer_id, items)
 
 
 @mcp.tool()
@@ -150,31 +158,12 @@ async def process_payment(
     payment_details: Optional[Dict[str, Any]] = None
 ) -> str:
     """Process payment with an ACP-compliant merchant"""
-    try:
-        logger.info(f"Process payment called with: merchant_id={merchant_id}, order_id={order_id}, amount={amount}")
-        
-        if acp_client is None:
-            return "❌ ACP client not initialized. Please check the server configuration."
-        
-        # Ensure proper type conversion
-        try:
-            amount = float(amount)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Parameter conversion failed: {e}")
-            return f"❌ Invalid amount value. Please provide a valid number."
-        
-        arguments = {
-            "merchant_id": merchant_id,
-            "order_id": order_id,
-            "amount": amount,
-            "payment_method": payment_method,
-            "payment_details": payment_details or {}
-        }
-        result = await handle_process_payment(arguments)
-        return result[0].text if result else "Payment failed"
-    except Exception as e:
-        logger.error(f"Unexpected error in process payment: {e}")
-        return f"❌ Payment failed: {str(e)}"
+    logger.info("Process payment called with: merchant_id=%s, order_id=%s, amount=%s", merchant_id, order_id, amount)
+    # amount is already coerced to float by FastMCP from the signature type
+    return await _run_commerce_tool(
+        CommerceOperation.PROCESS_PAYMENT,
+        merchant_id, order_id, amount, payment_method, payment_details or {}
+    )
 
 
 @mcp.tool()
@@ -183,21 +172,8 @@ async def get_menu(
     category: Optional[str] = None
 ) -> str:
     """Get menu from an ACP-compliant merchant"""
-    try:
-        logger.info(f"Get menu called with: merchant_id={merchant_id}, category={category}")
-        
-        if acp_client is None:
-            return "❌ ACP client not initialized. Please check the server configuration."
-        
-        arguments = {
-            "merchant_id": merchant_id,
-            "category": category
-        }
-        result = await handle_get_menu(arguments)
-        return result[0].text if result else "Menu retrieval failed"
-    except Exception as e:
-        logger.error(f"Unexpected error in get menu: {e}")
-        return f"❌ Menu retrieval failed: {str(e)}"
+    logger.info("Get menu called with: merchant_id=%s, category=%s", merchant_id, category)
+    return await _run_commerce_tool(CommerceOperation.GET_MENU, merchant_id, category)
 
 
 @mcp.tool()
@@ -206,21 +182,8 @@ async def track_order(
     order_id: str
 ) -> str:
     """Track order status with an ACP-compliant merchant"""
-    try:
-        logger.info(f"Track order called with: merchant_id={merchant_id}, order_id={order_id}")
-        
-        if acp_client is None:
-            return "❌ ACP client not initialized. Please check the server configuration."
-        
-        arguments = {
-            "merchant_id": merchant_id,
-            "order_id": order_id
-        }
-        result = handle_track_order(arguments)
-        return result[0].text if result else "Order tracking failed"
-    except Exception as e:
-        logger.error(f"Unexpected error in track order: {e}")
-        return f"❌ Order tracking failed: {str(e)}"
+    logger.info("Track order called with: merchant_id=%s, order_id=%s", merchant_id, order_id)
+    return await _run_commerce_tool(CommerceOperation.TRACK_ORDER, merchant_id, order_id)
 
 
 @mcp.tool()
@@ -233,19 +196,14 @@ async def process_settlement(
 ) -> str:
     """Process settlement and revenue distribution for a completed transaction"""
     try:
-        logger.info(f"Process settlement called with: transaction_id={transaction_id}, order_id={order_id}")
-        
-        arguments = {
-            "transaction_id": transaction_id,
-            "order_id": order_id,
-            "merchant_id": merchant_id,
-            "settlement_amount": settlement_amount,
-            "revenue_split": revenue_split
-        }
-        result = await handle_process_settlement(arguments)
+        logger.info("Process settlement called with: transaction_id=%s, order_id=%s", transaction_id, order_id)
+        
+        result = await handle_process_settlement(
+            transaction_id, order_id, merchant_id, settlement_amount, revenue_split
+        )
         return result[0].text if result else "Settlement processing failed"
     except Exception as e:
-        logger.error(f"Unexpected error in process settlement: {e}")
+        logger.error("Unexpected error in process settlement: %s", e)
         return f"❌ Settlement processing failed: {str(e)}"
 
 
@@ -258,18 +216,14 @@ async def process_attribution(
 ) -> str:
     """Process attribution and tracking for offer usage"""
     try:
-        logger.info(f"Process attribution called with: transaction_id={transaction_id}, offer_id={offer_id}")
-        
-        arguments = {
-            "transaction_id": transaction_id,
-            "offer_id": offer_id,
-            "merchant_id": merchant_id,
-            "attribution_data": attribution_data
-        }
-        result = await handle_process_attribution(arguments)
+        logger.info("Process attribution called with: transaction_id=%s, offer_id=%s", transaction_id, offer_id)
+        
+        result = await handle_process_attribution(
+            transaction_id, offer_id, merchant_id, attribution_data
+        )
         return result[0].text if result else "Attribution processing failed"
     except Exception as e:
-        logger.error(f"Unexpected error in process attribution: {e}")
+        logger.error("Unexpected error in process attribution: %s", e)
         return f"❌ Attribution processing failed: {str(e)}"
 
 
@@ -285,37 +239,16 @@ def offers_search(
 ) -> str:
     """Search for offers using semantic query with optional geo and label filters"""
     try:
-        logger.info(f"Search offers called with: query={query}, lat={lat}, lng={lng}, radius_m={radius_m}, limit={limit}")
-        
-        # Ensure proper type conversion - handle string inputs from MCP
-        try:
-            if lat is not None:
-                lat = float(lat)
-            if lng is not None:
-                lng = float(lng)
-            if radius_m is not None:
-                radius_m = int(radius_m)
-            if limit is not None:
-                limit = int(limit)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Parameter conversion failed: {e}")
-            return f"❌ Invalid parameter values. Please provide valid numbers for lat, lng, radius_m, and limit."
-        
-        arguments = {
-            "query": query,
-            "lat": lat,
-            "lng": lng,
-            "radius_m": radius_m,
-            "labels": labels,
-            "limit": limit
-        }
-        result = handle_search_offers(arguments)
+        logger.info("Search offers called with: query=%s, lat=%s, lng=%s, radius_m=%s, limit=%s", query, lat, lng, radius_m, limit)
+        
+        # Numeric parameters are already coerced by FastMCP, string inputs included
+        result = handle_search_offers(query, lat, lng, radius_m, labels, limit)
         return result[0].text if result else "No results found"
     except (ValueError, TypeError) as e:
-        logger.error(f"Parameter type error in search: {e}")
+        logger.error("Parameter type error in search: %s", e)
         return f"❌ Invalid parameter type: {str(e)}"
     except Exception as e:
-        logger.error(f"Unexpected error in search: {e}")
+        logger.error("Unexpected error in search: %s", e)
         return f"❌ Search failed: {str(e)}"
 
 
@@ -323,7 +256,7 @@ def offers_search(
 def offers_get_by_id(offer_id: str) -> str:
     """Get a specific offer by its ID"""
     try:
-        logger.info(f"Get offer by ID called with: offer_id={offer_id}")
+        logger.info("Get offer by ID called with: offer_id=%s", offer_id)
         
         # Check if GOR client is available
         if gor_client is None:
@@ -331,11 +264,10 @@ def offers_get_by_id(offer_id: str) -> str:
         if not gor_client.health_check():
             return "❌ GOR API is not available. Please check if the service is running."
         
-        arguments = {"offer_id": offer_id}
-        result = handle_get_offer_by_id(arguments)
+        result = handle_get_offer_by_id(offer_id)
         return result[0].text if result else "Offer not found"
     except Exception as e:
-        logger.error(f"Unexpected error in get offer by ID: {e}")
+        logger.error("Unexpected error in get offer by ID: %s", e)
         return f"❌ Get offer failed: {str(e)}"
 
 
@@ -348,42 +280,30 @@ def offers_nearby(
 ) -> str:
     """Find offers near a specific location"""
     try:
-        logger.info(f"Nearby offers called with: lat={lat}, lng={lng}, radius_m={radius_m}, limit={limit}")
-        
-        # Ensure proper type conversion - handle string inputs from MCP
-        try:
-            lat = float(lat) if lat is not None else 0.0
-            lng = float(lng) if lng is not None else 0.0
-            radius_m = int(radius_m) if radius_m is not None else 50000
-            limit = int(limit) if limit is not None else 20
-        except (ValueError, TypeError) as e:
-            logger.error(f"Parameter conversion failed: {e}")
-            return f"❌ Invalid parameter values. Please provide valid numbers for lat, lng, radius_m, and limit."
-        
-        arguments = {
-            "lat": lat,
-            "lng": lng,
-            "radius_m": radius_m,
-            "limit": limit
-        }
-        result = handle_nearby_offers(arguments)
+        logger.info("Nearby offers called with: lat=%s, lng=%s, radius_m=%s, limit=%s", lat, lng, radius_m, limit)
+        
+        # Numeric parameters are required and already coerced by FastMCP, string inputs included
+        result = handle_nearby_offers(lat, lng, radius_m, limit)
         return result[0].text if result else "No nearby offers found"
     except (ValueError, TypeError) as e:
-        logger.error(f"Parameter type error in nearby: {e}")
+        logger.error("Parameter type error in nearby: %s", e)
         return f"❌ Invalid parameter type: {str(e)}"
     except Exception as e:
-        logger.error(f"Unexpected error in nearby: {e}")
+        logger.error("Unexpected error in nearby: %s", e)
         return f"❌ Nearby search failed: {str(e)}"
 
 
-async def handle_discover_merchants(arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_discover_merchants(
+    query: Optional[str] = None,
+    lat: Optional[float] = None,
+    lng: Optional[float] = None,
+    radius_m: Optional[int] = None,
+    cuisine_type: Optional[str] = None
+) -> List[TextContent]:
     """Handle discover_merchants tool call using vector search"""
     try:
-        query = arguments.get("query", "")
-        lat = arguments.get("lat")
-        lng = arguments.get("lng")
-        radius_m = arguments.get("radius_m", 50000)
-        cuisine_type = arguments.get("cuisine_type")
+        if radius_m is None:
+            radius_m = 50000
         
         # Use GOR to search for merchants via their offers
         gor_client = GORClient()
@@ -415,54 +335,53 @@ async def handle_discover_merchants(arguments: Dict[str, Any]) -> List[TextConte
         # Extract unique merchants from offers
         merchants = {}
         for offer in offers:
-            # Extract merchant info from offer data
+            # Extract merchant info from offer data, reading each attribute once
+            merchant = getattr(offer, 'merchant', None)
+            content = getattr(offer, 'content', None)
+            restaurant_description = getattr(content, 'restaurant_description', None)
             merchant_id = None
             merchant_name = None
-            cuisine_type = "General"
-            description = "Restaurant"
             
             # Try to get merchant info from various sources
-            if hasattr(offer, 'merchant') and offer.merchant and hasattr(offer.merchant, 'id') and offer.merchant.id:
-                merchant_id = offer.merchant.id
-                merchant_name = offer.merchant.name or merchant_id
-            elif hasattr(offer, 'content') and offer.content and hasattr(offer.content, 'restaurant_description'):
+            if merchant and getattr(merchant, 'id', None):
+                merchant_id = merchant.id
+                merchant_name = merchant.name or merchant_id
+            elif restaurant_description:
                 # Extract merchant name from restaurant description
-                desc = offer.content.restaurant_description
-                if "OTTO Portland" in desc:
-                    merchant_id = "otto_portland"
-                    merchant_name = "OTTO Portland"
-                elif "Street Exeter" in desc:
-                    merchant_id = "street_exeter"
-                    merchant_name = "Street Exeter"
-                elif "Newick's Lobster House" in desc:
-                    merchant_id = "newicks_lobster"
-                    merchant_name = "Newick's Lobster House"
+                for known_name, known_id in _KNOWN_MERCHANTS:
+                    if known_name in restaurant_description:
+                        merchant_id = known_id
+                        merchant_name = known_name
+                        break
             
-            if hasattr(offer, 'content') and offer.content:
-                if hasattr(offer.content, 'cuisine_type') and offer.content.cuisine_type:
-                    cuisine_type = offer.content.cuisine_type
-                if hasattr(offer.content, 'restaurant_description') and offer.content.restaurant_description:
-                    description = offer.content.restaurant_description[:200] + "..." if len(offer.content.restaurant_description) > 200 else offer.content.restaurant_description
+            if not merchant_id:
+                continue
             
-            if merchant_id:
-                if merchant_id not in merchants:
-                    merchants[merchant_id] = {
-                        "merchant_id": merchant_id,
-                        "name": merchant_name or merchant_id,
-                        "description": description,
-                        "location": {
-                            "lat": None,  # Would be extracted from merchant.location if available
-                            "lng": None
-                        },
-                        "cuisine_type": cuisine_type,
-                        "rating": 4.5,  # Default rating
-                        "is_acp_compliant": True,
-                        "agent_url": f"http://localhost:4001",  # Default agent URL
-                        "capabilities": ["order_food", "validate_offer", "process_payment"],
-                        "offer_count": 0
-                    }
-                
-                merchants[merchant_id]["offer_count"] += 1
+            # Merchants already seen only need their offer count bumped
+            known_merchant = merchants.get(merchant_id)
+            if known_merchant is not None:
+                known_merchant["offer_count"] += 1
+                continue
+            
+            description = restaurant_description or "Restaurant"
+            if len(description) > 200:
+                description = description[:200] + "..."
+            
+            merchants[merchant_id] = {
+                "merchant_id": merchant_id,
+                "name": merchant_name or merchant_id,
+                "description": description,
+                "location": {
+                    "lat": None,  # Would be extracted from merchant.location if available
+                    "lng": None
+                },
+                "cuisine_type": getattr(content, 'cuisine_type', None) or "General",
+                "rating": 4.5,  # Default rating
+                "is_acp_compliant": True,
+                "agent_url": f"http://localhost:4001",  # Default agent URL
+                "capabilities": ["order_food", "validate_offer", "process_payment"],
+                "offer_count": 1
+            }
         
         # Convert to list and sort by offer count
         merchant_list = list(merchants.values())
@@ -475,62 +394,61 @@ async def handle_discover_merchants(arguments: Dict[str, Any]) -> List[TextConte
             )]
         
         # Build response text
-        response_text = f"🔍 Found {len(merchant_list)} ACP-compliant merchants"
+        parts = [f"🔍 Found {len(merchant_list)} ACP-compliant merchants"]
         if query:
-            response_text += f" for '{query}'"
+            parts.append(f" for '{query}'")
         if cuisine_type:
-            response_text += f" with cuisine type '{cuisine_type}'"
+            parts.append(f" with cuisine type '{cuisine_type}'")
         if lat and lng:
-            response_text += f" within {radius_m}m of ({lat}, {lng})"
-        response_text += f"\n\n"
+            parts.append(f" within {radius_m}m of ({lat}, {lng})")
+        parts.append("\n\n")
         
         for i, merchant in enumerate(merchant_list, 1):
-            response_text += f"{i}. **{merchant['name']}**\n"
-            response_text += f"   📝 {merchant['description'][:100]}...\n" if len(merchant['description']) > 100 else f"   📝 {merchant['description']}\n"
-            response_text += f"   🏪 {merchant['cuisine_type']} cuisine\n"
-            response_text += f"   ⭐ Rating: {merchant['rating']}/5\n"
-            response_text += f"   🆔 {merchant['merchant_id']}\n"
-            response_text += f"   📊 {merchant['offer_count']} active offers\n"
+            description = merchant['description']
+            if len(description) > 100:
+                description = f"{description[:100]}..."
+            parts.append(
+                f"{i}. **{merchant['name']}**\n"
+                f"   📝 {description}\n"
+                f"   🏪 {merchant['cuisine_type']} cuisine\n"
+                f"   ⭐ Rating: {merchant['rating']}/5\n"
+                f"   🆔 {merchant['merchant_id']}\n"
+                f"   📊 {merchant['offer_count']} active offers\n"
+            )
             if merchant['location']['lat'] and merchant['location']['lng']:
-                response_text += f"   📍 Location: ({merchant['location']['lat']}, {merchant['location']['lng']})\n"
-            response_text += f"   🌐 {merchant['agent_url']}\n\n"
+                parts.append(f"   📍 Location: ({merchant['location']['lat']}, {merchant['location']['lng']})\n")
+            parts.append(f"   🌐 {merchant['agent_url']}\n\n")
         
         return [TextContent(
             type="text",
-            text=response_text
+            text="".join(parts)
         )]
         
     except Exception as e:
-        logger.error(f"Discover merchants failed: {e}")
+        logger.error("Discover merchants failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Merchant discovery failed: {str(e)}"
         )]
 
 
-async def handle_order_food(arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_order_food(
+    merchant_id: str,
+    items_data: List[Dict[str, Any]],
+    offer_id: Optional[str] = None,
+    pickup: bool = True,
+    delivery_address: Optional[Dict[str, str]] = None,
+    special_instructions: Optional[str] = None
+) -> List[TextContent]:
     """Handle order_food tool call"""
     try:
-        merchant_id = arguments["merchant_id"]
-        items_data = arguments["items"]
-        offer_id = arguments.get("offer_id")
-        pickup = arguments.get("pickup", True)
-        delivery_address = arguments.get("delivery_address")
-        special_instructions = arguments.get("special_instructions")
-        
-        # Convert items to OrderItem objects
-        items = [
-            OrderItem(
-                name=item["name"],
-                quantity=item["quantity"],
-                price=item.get("price"),
-                notes=item.get("notes")
-            )
-            for item in items_data
-        ]
+        # Convert items to OrderItem objects; item dicts are free-form tool
+        # input, so they are validated here in one pydantic-core call
+        items = _ORDER_ITEMS_ADAPTER.validate_python(items_data)
         
-        # Create order request
-        request = OrderRequest(
+        # Create order request; the remaining fields were typed by the tool
+        # signature and the items validated above, so skip re-validation
+        request = OrderRequest.model_construct(
             merchant_id=merchant_id,
             items=items,
             offer_id=offer_id,
@@ -543,17 +461,19 @@ async def handle_order_food(arguments: Dict[str, Any]) -> List[TextContent]:
         response = await acp_client.order_food(request)
         
         if response.success:
-            response_text = f"✅ Order placed successfully!\n\n"
-            response_text += f"**Order ID**: {response.data.get('order_id', 'N/A')}\n"
-            response_text += f"**Total**: ${response.data.get('total', 'N/A')}\n"
-            response_text += f"**Status**: {response.data.get('status', 'N/A')}\n"
-            response_text += f"**Merchant**: {merchant_id}\n"
+            parts = [_ORDER_PLACED_TEMPLATE.format(
+                order_id=response.data.get('order_id', 'N/A'),
+                total=response.data.get('total', 'N/A'),
+                status=response.data.get('status', 'N/A'),
+                merchant_id=merchant_id
+            )]
             
             if offer_id:
-                response_text += f"**Offer Applied**: {offer_id}\n"
+                parts.append(f"**Offer Applied**: {offer_id}\n")
             
             if special_instructions:
-                response_text += f"**Special Instructions**: {special_instructions}\n"
+                parts.append(f"**Special Instructions**: {special_instructions}\n")
+            response_text = "".join(parts)
         else:
             response_text = f"❌ Order failed: {response.error_message}"
         
@@ -563,20 +483,20 @@ async def handle_order_food(arguments: Dict[str, Any]) -> List[TextContent]:
         )]
         
     except Exception as e:
-        logger.error(f"Order food failed: {e}")
+        logger.error("Order food failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Order failed: {str(e)}"
         )]
 
 
-async def handle_validate_offer(arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_validate_offer(
+    merchant_id: str,
+    offer_id: str,
+    items_data: List[Dict[str, Any]]
+) -> List[TextContent]:
     """Handle validate_offer tool call"""
     try:
-        merchant_id = arguments["merchant_id"]
-        offer_id = arguments["offer_id"]
-        items_data = arguments["items"]
-        
         # First, check if the offer exists in the GOR
         gor_client = GORClient()
         
@@ -615,18 +535,12 @@ async def handle_validate_offer(arguments: Dict[str, Any]) -> List[TextContent]:
             except Exception:
                 pass  # Continue if date parsing fails
         
-        # Convert items to OrderItem objects
-        items = [
-            OrderItem(
-                name=item["name"],
-                quantity=item["quantity"],
-                price=item.get("price")
-            )
-            for item in items_data
-        ]
+        # Convert items to OrderItem objects; item dicts are free-form tool
+        # input, so they are validated here in one pydantic-core call
+        items = _ORDER_ITEMS_ADAPTER.validate_python(items_data)
         
-        # Create validation request
-        request = OfferValidationRequest(
+        # Create validation request from trusted, already-validated values
+        request = OfferValidationRequest.model_construct(
             merchant_id=merchant_id,
             offer_id=offer_id,
             items=items
@@ -661,27 +575,29 @@ async def handle_validate_offer(arguments: Dict[str, Any]) -> List[TextContent]:
         )]
         
     except Exception as e:
-        logger.error(f"Validate offer failed: {e}")
+        logger.error("Validate offer failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Offer validation failed: {str(e)}"
         )]
 
 
-async def handle_process_payment(arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_process_payment(
+    merchant_id: str,
+    order_id: str,
+    amount: float,
+    payment_method: str,
+    payment_details: Dict[str, Any]
+) -> List[TextContent]:
     """Handle process_payment tool call"""
     try:
-        merchant_id = arguments["merchant_id"]
-        order_id = arguments["order_id"]
-        amount = arguments["amount"]
-        payment_method = arguments["payment_method"]
-        payment_details = arguments.get("payment_details", {})
-        
-        # Create payment request
-        request = PaymentRequest(
+        # Create payment request; fields were typed by the tool signature, so
+        # skip re-validation. amount arrives as a float and the model field is a
+        # Decimal, so convert it here (via str to keep the value as written)
+        request = PaymentRequest.model_construct(
             merchant_id=merchant_id,
             order_id=order_id,
-            amount=amount,
+            amount=Decimal(str(amount)),
             payment_method=payment_method,
             payment_details=payment_details
         )
@@ -690,13 +606,14 @@ async def handle_process_payment(arguments: Dict[str, Any]) -> List[TextContent]
         response = await acp_client.process_payment(request)
         
         if response.success:
-            response_text = f"✅ Payment processed successfully!\n\n"
-            response_text += f"**Payment ID**: {response.data.get('payment_id', 'N/A')}\n"
-            response_text += f"**Order ID**: {order_id}\n"
-            response_text += f"**Amount**: ${amount}\n"
-            response_text += f"**Status**: {response.data.get('status', 'N/A')}\n"
-            response_text += f"**Method**: {payment_method}\n"
-            response_text += f"**Merchant**: {merchant_id}\n"
+            response_text = _PAYMENT_PROCESSED_TEMPLATE.format(
+                payment_id=response.data.get('payment_id', 'N/A'),
+                order_id=order_id,
+                amount=amount,
+                status=response.data.get('status', 'N/A'),
+                payment_method=payment_method,
+                merchant_id=merchant_id
+            )
             
             if response.data.get('transaction_id'):
                 response_text += f"**Transaction ID**: {response.data['transaction_id']}\n"
@@ -709,19 +626,16 @@ async def handle_process_payment(arguments: Dict[str, Any]) -> List[TextContent]
         )]
         
     except Exception as e:
-        logger.error(f"Process payment failed: {e}")
+        logger.error("Process payment failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Payment failed: {str(e)}"
         )]
 
 
-async def handle_get_menu(arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_get_menu(merchant_id: str, category: Optional[str] = None) -> List[TextContent]:
     """Handle get_menu tool call"""
     try:
-        merchant_id = arguments["merchant_id"]
-        category = arguments.get("category")
-        
         # Execute menu request
         response = await acp_client.get_menu(merchant_id, category)
         
@@ -729,28 +643,29 @@ async def handle_get_menu(arguments: Dict[str, Any]) -> List[TextContent]:
             menu_items = response.data.get("menu_items", [])
             categories = response.data.get("categories", [])
             
-            response_text = f"🍽️ Menu for {merchant_id}\n\n"
+            parts = [f"🍽️ Menu for {merchant_id}\n\n"]
             
             if category:
-                response_text += f"**Category**: {category}\n\n"
+                parts.append(f"**Category**: {category}\n\n")
             
             if categories:
-                response_text += f"**Available Categories**: {', '.join(categories)}\n\n"
+                parts.append(f"**Available Categories**: {', '.join(categories)}\n\n")
             
             if menu_items:
-                response_text += f"**Menu Items** ({len(menu_items)} items):\n\n"
+                parts.append(f"**Menu Items** ({len(menu_items)} items):\n\n")
                 for i, item in enumerate(menu_items, 1):
-                    response_text += f"{i}. **{item.get('name', 'N/A')}**\n"
+                    parts.append(f"{i}. **{item.get('name', 'N/A')}**\n")
                     if item.get('description'):
-                        response_text += f"   📝 {item['description']}\n"
-                    response_text += f"   💰 ${item.get('price', 'N/A')}\n"
+                        parts.append(f"   📝 {item['description']}\n")
+                    parts.append(f"   💰 ${item.get('price', 'N/A')}\n")
                     if item.get('category'):
-                        response_text += f"   📂 {item['category']}\n"
+                        parts.append(f"   📂 {item['category']}\n")
                     if not item.get('available', True):
-                        response_text += f"   ❌ Not available\n"
-                    response_text += "\n"
+                        parts.append("   ❌ Not available\n")
+                    parts.append("\n")
             else:
-                response_text += "No menu items found."
+                parts.append("No menu items found.")
+            response_text = "".join(parts)
         else:
             response_text = f"❌ Menu retrieval failed: {response.error_message}"
         
@@ -760,27 +675,19 @@ async def handle_get_menu(arguments: Dict[str, Any]) -> List[TextContent]:
         )]
         
     except Exception as e:
-        logger.error(f"Get menu failed: {e}")
+        logger.error("Get menu failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Menu retrieval failed: {str(e)}"
         )]
 
 
-def handle_track_order(arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_track_order(merchant_id: str, order_id: str) -> List[TextContent]:
     """Handle track_order tool call"""
     try:
-        merchant_id = arguments["merchant_id"]
-        order_id = arguments["order_id"]
-        
         # For now, return mock tracking info
         # In a real implementation, this would query the merchant agent
-        response_text = f"📦 Order Tracking\n\n"
-        response_text += f"**Order ID**: {order_id}\n"
-        response_text += f"**Merchant**: {merchant_id}\n"
-        response_text += f"**Status**: Preparing\n"
-        response_text += f"**Estimated Ready Time**: 2024-01-15T19:30:00Z\n"
-        response_text += f"**Last Updated**: 2024-01-15T19:15:00Z\n"
+        response_text = _ORDER_TRACKING_TEMPLATE.format(order_id=order_id, merchant_id=merchant_id)
         
         return [TextContent(
             type="text",
@@ -788,7 +695,7 @@ def handle_track_order(arguments: Dict[str, Any]) -> List[TextContent]:
         )]
         
     except Exception as e:
-        logger.error(f"Track order failed: {e}")
+        logger.error("Track order failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Order tracking failed: {str(e)}"
@@ -796,11 +703,25 @@ def handle_track_order(arguments: Dict[str, Any]) -> List[TextContent]:
 
 
 # Offer Discovery Handlers
-def handle_search_offers(arguments: Dict[str, Any]) -> List[TextContent]:
+def handle_search_offers(
+    query: Optional[str] = None,
+    lat: Optional[float] = None,
+    lng: Optional[float] = None,
+    radius_m: Optional[int] = None,
+    labels: Optional[List[str]] = None,
+    limit: Optional[int] = None
+) -> List[TextContent]:
     """Handle offers.search tool call"""
     try:
         # Parse arguments
-        params = SearchOffersInput(**arguments)
+        params = SearchOffersInput(
+            query=query,
+            lat=lat,
+            lng=lng,
+            radius_m=radius_m,
+            labels=labels,
+            limit=limit
+        )
         
         # Check if GOR client is available
         if gor_client is None:
@@ -834,50 +755,50 @@ def handle_search_offers(arguments: Dict[str, Any]) -> List[TextContent]:
             )]
         
         # Build response text
-        response_text = f"🔍 Found {results.total} offers"
+        parts = [f"🔍 Found {results.total} offers"]
         if params.query:
-            response_text += f" for '{params.query}'"
+            parts.append(f" for '{params.query}'")
         if params.lat and params.lng:
-            response_text += f" near ({params.lat}, {params.lng})"
-        response_text += f"\n\n"
+            parts.append(f" near ({params.lat}, {params.lng})")
+        parts.append("\n\n")
         
         for i, offer in enumerate(offers[:params.limit or 20], 1):
-            response_text += f"{i}. **{offer.title or offer.offer_id}**\n"
+            parts.append(f"{i}. **{offer.title or offer.offer_id}**\n")
             if offer.merchant:
-                response_text += f"   🏪 {offer.merchant.name}"
+                parts.append(f"   🏪 {offer.merchant.name}")
                 if offer.merchant.location and offer.merchant.location.city:
-                    response_text += f" ({offer.merchant.location.city})"
-                response_text += "\n"
+                    parts.append(f" ({offer.merchant.location.city})")
+                parts.append("\n")
             
             if offer.bounty:
-                response_text += f"   💰 ${offer.bounty.amount} bounty\n"
+                parts.append(f"   💰 ${offer.bounty.amount} bounty\n")
             
             if offer.labels:
-                response_text += f"   🏷️  {', '.join(offer.labels)}\n"
+                parts.append(f"   🏷️  {', '.join(offer.labels)}\n")
             
             if offer.description:
-                response_text += f"   📝 {offer.description}\n"
+                parts.append(f"   📝 {offer.description}\n")
             
-            response_text += f"   🆔 {offer.offer_id}\n\n"
+            parts.append(f"   🆔 {offer.offer_id}\n\n")
         
         return [TextContent(
             type="text",
-            text=response_text
+            text="".join(parts)
         )]
         
     except Exception as e:
-        logger.error(f"Search offers failed: {e}")
+        logger.error("Search offers failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Search offers failed: {str(e)}"
         )]
 
 
-def handle_get_offer_by_id(arguments: Dict[str, Any]) -> List[TextContent]:
+def handle_get_offer_by_id(offer_id: str) -> List[TextContent]:
     """Handle offers.getById tool call"""
     try:
         # Parse arguments
-        params = GetOfferByIdInput(**arguments)
+        params = GetOfferByIdInput(offer_id=offer_id)
         
         # Check if GOR client is available
         if gor_client is None:
@@ -946,18 +867,18 @@ def handle_get_offer_by_id(arguments: Dict[str, Any]) -> List[TextContent]:
         )]
         
     except Exception as e:
-        logger.error(f"Get offer by ID failed: {e}")
+        logger.error("Get offer by ID failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Get offer failed: {str(e)}"
         )]
 
 
-def handle_nearby_offers(arguments: Dict[str, Any]) -> List[TextContent]:
+def handle_nearby_offers(lat: float, lng: float, radius_m: int, limit: int) -> List[TextContent]:
     """Handle offers.nearby tool call"""
     try:
         # Parse arguments
-        params = NearbyOffersInput(**arguments)
+        params = NearbyOffersInput(lat=lat, lng=lng, radius_m=radius_m, limit=limit)
         
         # Check if GOR client is available
         if gor_client is None:
@@ -991,50 +912,50 @@ def handle_nearby_offers(arguments: Dict[str, Any]) -> List[TextContent]:
             )]
         
         # Build response text
-        response_text = f"📍 Found {results.total} offers within {params.radius_m}m of ({params.lat}, {params.lng})\n\n"
+        parts = [f"📍 Found {results.total} offers within {params.radius_m}m of ({params.lat}, {params.lng})\n\n"]
         
         for i, offer in enumerate(offers[:params.limit or 20], 1):
-            response_text += f"{i}. **{offer.title or offer.offer_id}**\n"
+            parts.append(f"{i}. **{offer.title or offer.offer_id}**\n")
             if offer.merchant:
-                response_text += f"   🏪 {offer.merchant.name}"
+                parts.append(f"   🏪 {offer.merchant.name}")
                 if offer.merchant.location:
                     loc = offer.merchant.location
                     if loc.city and loc.state:
-                        response_text += f" ({loc.city}, {loc.state})"
+                        parts.append(f" ({loc.city}, {loc.state})")
                     elif loc.address:
-                        response_text += f" ({loc.address})"
-                response_text += "\n"
+                        parts.append(f" ({loc.address})")
+                parts.append("\n")
             
             if offer.bounty:
-                response_text += f"   💰 ${offer.bounty.amount} bounty\n"
+                parts.append(f"   💰 ${offer.bounty.amount} bounty\n")
             
             if offer.labels:
-                response_text += f"   🏷️  {', '.join(offer.labels)}\n"
+                parts.append(f"   🏷️  {', '.join(offer.labels)}\n")
             
-            response_text += f"   🆔 {offer.offer_id}\n\n"
+            parts.append(f"   🆔 {offer.offer_id}\n\n")
         
         return [TextContent(
             type="text",
-            text=response_text
+            text="".join(parts)
         )]
         
     except Exception as e:
-        logger.error(f"Nearby offers failed: {e}")
+        logger.error("Nearby offers failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Nearby offers failed: {str(e)}"
         )]
 
 
-async def handle_process_settlement(arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_process_settlement(
+    transaction_id: str,
+    order_id: str,
+    merchant_id: str,
+    settlement_amount: float,
+    revenue_split: Dict[str, float]
+) -> List[TextContent]:
     """Handle process_settlement tool call"""
     try:
-        transaction_id = arguments["transaction_id"]
-        order_id = arguments["order_id"]
-        merchant_id = arguments["merchant_id"]
-        settlement_amount = arguments["settlement_amount"]
-        revenue_split = arguments["revenue_split"]
-        
         # Import transaction simulator client
         import aiohttp
         import json
@@ -1083,21 +1004,21 @@ async def handle_process_settlement(arguments: Dict[str, Any]) -> List[TextConte
                     )]
         
     except Exception as e:
-        logger.error(f"Process settlement failed: {e}")
+        logger.error("Process settlement failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Settlement processing failed: {str(e)}"
         )]
 
 
-async def handle_process_attribution(arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_process_attribution(
+    transaction_id: str,
+    offer_id: str,
+    merchant_id: str,
+    attribution_data: Dict[str, Any]
+) -> List[TextContent]:
     """Handle process_attribution tool call"""
     try:
-        transaction_id = arguments["transaction_id"]
-        offer_id = arguments["offer_id"]
-        merchant_id = arguments["merchant_id"]
-        attribution_data = arguments["attribution_data"]
-        
         # Import transaction simulator client
         import aiohttp
         import json
@@ -1142,22 +1063,34 @@ async def handle_process_attribution(arguments: Dict[str, Any]) -> List[TextCont
                     )]
         
     except Exception as e:
-        logger.error(f"Process attribution failed: {e}")
+        logger.error("Process attribution failed: %s", e)
         return [TextContent(
             type="text",
             text=f"❌ Attribution processing failed: {str(e)}"
         )]
 
 
+# Commerce tool handlers by operation, with the text returned when a handler
+# produces no output and the prefix used for unexpected errors
+_COMMERCE_DISPATCH: Dict[CommerceOperation, Tuple[Callable[..., Awaitable[List[TextContent]]], str, str]] = {
+    CommerceOperation.DISCOVER_MERCHANTS: (handle_discover_merchants, "No merchants found", "Merchant discovery failed"),
+    CommerceOperation.ORDER_FOOD: (handle_order_food, "Order failed", "Order failed"),
+    CommerceOperation.VALIDATE_OFFER: (handle_validate_offer, "Offer validation failed", "Offer validation failed"),
+    CommerceOperation.PROCESS_PAYMENT: (handle_process_payment, "Payment failed", "Payment failed"),
+    CommerceOperation.GET_MENU: (handle_get_menu, "Menu retrieval failed", "Menu retrieval failed"),
+    CommerceOperation.TRACK_ORDER: (handle_track_order, "Order tracking failed", "Order tracking failed"),
+}
+
+
 def main(a2a_server_url: str = None):
     """Initialize ACP client and run MCP server."""
     global acp_client
     
     try:
         acp_client = ACPClient(a2a_server_url)
-        logger.info(f"ACP client initialized successfully")
+        logger.info("ACP client initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize ACP client: {e}")
+        logger.error("Failed to initialize ACP client: %s", e)
         acp_client = None
     
     mcp.run(transport="stdio")
@@ -125,6 +125,9 @@ class OrderSummary(BaseModel):
     estimated_ready_time: Optional[datetime] = Field(None, description="Estimated ready time")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Order creation time")
     
+    class Config:
+        frozen = True
+    
     @validator('total')
     def validate_total(cls, v, values):
         """Ensure total matches calculated sum."""
@@ -170,6 +173,9 @@ class PaymentDetails(BaseModel):
     transaction_id: Optional[str] = Field(None, description="External transaction ID")
     processed_at: datetime = Field(default_factory=datetime.utcnow, description="Payment processing time")
     error_message: Optional[str] = Field(None, description="Error message if payment failed")
+    
+    class Config:
+        frozen = True
 
 
 class CommerceTask(BaseModel):
@@ -230,6 +236,9 @@ class CommerceResult(BaseModel):
     error_message: Optional[str] = Field(None, description="Error message if task failed")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional result metadata")
     completed_at: datetime = Field(default_factory=datetime.utcnow, description="Task completion time")
+    
+    class Config:
+        frozen = True
 
 
 class OrderResult(CommerceResult):
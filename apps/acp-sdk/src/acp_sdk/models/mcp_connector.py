@@ -2,13 +2,27 @@
 ACP MCP Server Data Models - Standardized request/response structures.
 """
 
+import os
+import threading
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-from uuid import UUID, uuid4
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
+
+# Request ids are drawn from per-thread pools refilled with one urandom call
+_REQUEST_ID_BATCH = 256
+_request_id_pool = threading.local()
+
+
+def _new_request_id() -> str:
+    """Return a random 128-bit hex request identifier."""
+    pool = getattr(_request_id_pool, "ids", None)
+    if not pool:
+        entropy = os.urandom(16 * _REQUEST_ID_BATCH).hex()
+        pool = _request_id_pool.ids = [entropy[i:i + 32] for i in range(0, len(entropy), 32)]
+    return pool.pop()
 
 
 class CommerceOperation(str, Enum):
@@ -70,13 +84,13 @@ class CommerceRequest(BaseModel):
     user_id: Optional[str] = Field(None, description="User making the request")
     session_id: Optional[str] = Field(None, description="User session identifier")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional request metadata")
-    request_id: str = Field(default_factory=lambda: str(uuid4()), description="Unique request identifier")
+    request_id: str = Field(default_factory=_new_request_id, description="Unique request identifier")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Request timestamp")
 
 
 class OrderRequest(CommerceRequest):
     """Request for ordering food."""
-    operation: CommerceOperation = Field(CommerceOperation.ORDER_FOOD, description="Order food operation")
+    operation: Literal[CommerceOperation.ORDER_FOOD] = Field(CommerceOperation.ORDER_FOOD, description="Order food operation")
     items: List[OrderItem] = Field(..., description="Items to order")
     offer_id: Optional[str] = Field(None, description="Offer to apply")
     pickup: bool = Field(True, description="Whether this is pickup or delivery")
@@ -86,7 +100,7 @@ class OrderRequest(CommerceRequest):
 
 class PaymentRequest(CommerceRequest):
     """Request for payment processing."""
-    operation: CommerceOperation = Field(CommerceOperation.PROCESS_PAYMENT, description="Process payment operation")
+    operation: Literal[CommerceOperation.PROCESS_PAYMENT] = Field(CommerceOperation.PROCESS_PAYMENT, description="Process payment operation")
     order_id: str = Field(..., description="Order to pay for")
     amount: Decimal = Field(..., description="Amount to charge")
     payment_method: str = Field(..., description="Payment method to use")
@@ -95,7 +109,7 @@ class PaymentRequest(CommerceRequest):
 
 class OfferValidationRequest(CommerceRequest):
     """Request for offer validation."""
-    operation: CommerceOperation = Field(CommerceOperation.VALIDATE_OFFER, description="Validate offer operation")
+    operation: Literal[CommerceOperation.VALIDATE_OFFER] = Field(CommerceOperation.VALIDATE_OFFER, description="Validate offer operation")
     offer_id: str = Field(..., description="Offer to validate")
     items: List[OrderItem] = Field(..., description="Items to validate against")
 
@@ -0,0 +1,63 @@
+"""Tests for the HTTP client and agent state shared between ACPClient instances."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from acp_sdk.mcp import a2a_client
+from acp_sdk.mcp.a2a_client import ACPClient, close_shared_http_client
+
+
+def test_shared_client_is_scoped_to_the_event_loop():
+    client = ACPClient()
+
+    async def pooled_clients():
+        return client.http_client, ACPClient().http_client
+
+    first, first_other = asyncio.run(pooled_clients())
+    second, _ = asyncio.run(pooled_clients())
+
+    assert first is first_other
+    assert second is not first
+
+
+def test_injected_client_is_used_on_every_loop():
+    http_client = httpx.AsyncClient()
+    client = ACPClient(http_client=http_client)
+
+    async def current_client():
+        return client.http_client
+
+    assert asyncio.run(current_client()) is http_client
+    assert asyncio.run(current_client()) is http_client
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_in_flight_resolutions(monkeypatch):
+    client = ACPClient()
+    started = asyncio.Event()
+
+    async def resolve_agent(server_url):
+        started.set()
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(client, "_resolve_agent", resolve_agent)
+    resolution = asyncio.ensure_future(client._ensure_initialized("http://localhost:4001"))
+    await started.wait()
+
+    await close_shared_http_client()
+
+    with pytest.raises(asyncio.CancelledError):
+        await resolution
+    assert asyncio.get_running_loop() not in a2a_client._loop_states
+
+
+@pytest.mark.asyncio
+async def test_clients_on_the_shared_pool_share_one_gate():
+    first, second = ACPClient(), ACPClient()
+    pooled = ACPClient(limits=httpx.Limits(max_connections=5))
+
+    assert first._gate is second._gate
+    assert pooled._gate is not first._gate
+    await pooled.close()
@@ -0,0 +1,50 @@
+"""Tests for ACPAgent's cached agent card."""
+
+from acp_sdk.a2a.core import ACPAgent
+from acp_sdk.a2a.skills import BaseCommerceSkill
+
+
+class _LoyaltySkill(BaseCommerceSkill):
+    def __init__(self):
+        super().__init__(skill_name="Loyalty Points", description="Award loyalty points")
+
+    async def execute(self, task):
+        raise NotImplementedError
+
+
+def _skill_ids(agent):
+    return {skill.id for skill in agent.get_agent_card().skills}
+
+
+def _agent():
+    return ACPAgent(agent_id="test_agent", name="Test Agent", description="Test agent")
+
+
+def test_card_reflects_skills_added_directly_to_registry():
+    agent = _agent()
+    assert "acp_loyalty_points" not in _skill_ids(agent)
+
+    agent.commerce_skills.add_skill(_LoyaltySkill())
+
+    assert "acp_loyalty_points" in _skill_ids(agent)
+
+
+def test_card_reflects_removed_skills():
+    agent = _agent()
+    agent.add_custom_skill(_LoyaltySkill())
+    assert "acp_loyalty_points" in _skill_ids(agent)
+
+    agent.remove_skill("acp_loyalty_points")
+
+    assert "acp_loyalty_points" not in _skill_ids(agent)
+
+
+def test_card_is_reused_until_skills_change():
+    agent = _agent()
+    card = agent.get_agent_card()
+
+    assert agent.get_agent_card() is card
+
+    agent.add_custom_skill(_LoyaltySkill())
+
+    assert agent.get_agent_card() is not card
@@ -0,0 +1,50 @@
+"""Tests for the lazily loaded acp_sdk package exports."""
+
+import subprocess
+import sys
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+import acp_sdk
+
+
+def test_import_does_not_load_subsystems():
+    # Run in a fresh interpreter, since other tests have already loaded them
+    code = (
+        "import sys, acp_sdk\n"
+        "heavy = ('acp_sdk.mcp', 'mcp', 'a2a', 'qdrant_client', 'openai', 'aiohttp', 'httpx')\n"
+        "print(sorted(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_mcp_export_is_server_after_importing_acp_client():
+    # Importing ACPClient loads acp_sdk.mcp submodules, which binds the
+    # subpackage as an attribute of acp_sdk
+    from acp_sdk import ACPClient  # noqa: F401
+
+    assert isinstance(acp_sdk.mcp, FastMCP)
+
+    from acp_sdk import mcp
+
+    assert isinstance(mcp, FastMCP)
+
+
+def test_lazy_export_resolves_to_defining_module():
+    from acp_sdk.models.offers import Offer
+
+    assert acp_sdk.Offer is Offer
+
+
+def test_unknown_attribute_raises_attribute_error():
+    name = "not_an_export"
+
+    with pytest.raises(AttributeError, match=name):
+        getattr(acp_sdk, name)
+
+
+def test_all_exports_are_listed_in_dir():
+    assert set(acp_sdk.__all__) <= set(dir(acp_sdk))